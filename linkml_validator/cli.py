@@ -1,12 +1,13 @@
 import json
 import click
 from linkml_validator.utils import import_plugin
-from linkml_validator.validator import DEFAULT_PLUGINS, Validator
+from linkml_validator.validator import DEFAULT_PLUGINS, MultiValidator, Validator
 
 
 PLUGINS = {
     "JsonSchemaValidationPlugin": "linkml_validator.plugins.jsonschema_validation.JsonSchemaValidationPlugin",
     "RangeValidationPlugin": "linkml_validator.plugins.range_validation.RangeValidationPlugin",
+    "ReferentialIntegrityPlugin": "linkml_validator.plugins.referential_integrity.ReferentialIntegrityPlugin",
 }
 
 
@@ -19,7 +20,14 @@ PLUGINS = {
     type=click.Path(exists=True),
     help="Files to validate",
 )
-@click.option("--schema", "-s", required=True, help="The metadata schema in YAML")
+@click.option(
+    "--schema",
+    "-s",
+    required=True,
+    multiple=True,
+    help="The metadata schema in YAML. If more than one schema is given, "
+    "validation against each schema is compared with validation against the first schema.",
+)
 @click.option(
     "--output",
     "-o",
@@ -60,7 +68,10 @@ def cli(inputs, schema, output, target_class, plugins, strict):
         plugin_class_name = plugin.split(".")[-1]
         plugin_class = import_plugin(plugin_module_name, plugin_class_name)
         plugin_class_references.append({'plugin_class': plugin_class})
-    validator = Validator(schema=schema, plugins=plugin_class_references)
+    if len(schema) > 1:
+        validator = MultiValidator(schemas=list(schema), plugins=plugin_class_references)
+    else:
+        validator = Validator(schema=schema[0], plugins=plugin_class_references)
     for filename in inputs:
         reports = [x for x in validator.validate_file(filename=filename, target_class=target_class, strict=strict)]
         if output:
@@ -0,0 +1,123 @@
+from typing import Callable, Dict, List, Optional
+from linkml_runtime.utils.schemaview import SchemaView
+from linkml_runtime.utils.formatutils import camelcase, underscore
+
+
+class TypeDesignatorDispatcher:
+    """
+    Dispatcher to determine the type of an object from its type designator,
+    i.e. the value of a slot with `designates_type` set in the schema.
+
+    A lookup table of designator values is built once from the schema. A class
+    can be designated by its name, its Pythonic (CamelCase) name, its class URI
+    or its class CURIE.
+
+    Args:
+        schema: Path or URL to schema YAML
+
+    """
+
+    def __init__(self, schema: str) -> None:
+        self.schema = schema
+        self.schemaview = SchemaView(schema)
+        self.designator_fields = []
+        self.class_map = {}
+        self.fallback_map = {}
+        self._build_lookup()
+
+    def _build_lookup(self) -> None:
+        """
+        Build the lookup table of designator values, and the fallback class
+        for each type designator slot.
+        """
+        schemaview = self.schemaview
+        for slot_def in schemaview.all_slots().values():
+            if not slot_def.designates_type:
+                continue
+            field = underscore(slot_def.name)
+            if field in self.designator_fields:
+                continue
+            self.designator_fields.append(field)
+            fallback_class = self._get_fallback_class(
+                schemaview.get_classes_by_slot(slot_def, include_induced=True)
+            )
+            if fallback_class:
+                self.fallback_map[field] = fallback_class
+        if not self.designator_fields:
+            # No need for a lookup table if no object can have a type designator
+            return
+        for class_name, class_def in schemaview.all_classes().items():
+            if class_def.abstract or class_def.mixin:
+                continue
+            formatted_name = camelcase(class_name)
+            for value in [
+                class_name,
+                formatted_name,
+                schemaview.get_uri(class_name),
+                schemaview.get_uri(class_name, expand=True),
+            ]:
+                self.class_map.setdefault(value, formatted_name)
+
+    def _get_fallback_class(self, class_names: List[str]) -> Optional[str]:
+        """
+        Get the most general class, from a list of classes, that can
+        be used for objects with an unknown type.
+
+        Args:
+            class_names: The classes that have a type designator slot
+
+        Returns:
+            str: The Pythonic name of the fallback class, or `None` if there
+                is no single, non-abstract, most general class
+
+        """
+        roots = []
+        for class_name in class_names:
+            ancestors = self.schemaview.class_ancestors(class_name, reflexive=False)
+            if not any(x in class_names for x in ancestors):
+                roots.append(class_name)
+        if len(roots) != 1:
+            return None
+        class_def = self.schemaview.get_class(roots[0])
+        if class_def.abstract or class_def.mixin:
+            return None
+        return camelcase(roots[0])
+
+    def get_target_class(
+        self, obj: Dict, default: str = None, is_supported: Callable[[str], bool] = None
+    ) -> Optional[str]:
+        """
+        Get the type of an object from its type designator.
+
+        If the object has a type designator that does not refer to a (non-abstract)
+        class in the schema, or refers to a class that is not supported, then the
+        `default` class, if any, or the most general class with the type designator
+        slot is used instead. The type designator itself is still validated against
+        that class, so the object is reported as having an invalid type designator.
+
+        Args:
+            obj: The object
+            default: The type of object to use if it cannot be determined
+                from a type designator
+            is_supported: A function to check whether objects of a given type
+                can be validated. By default, all types are supported.
+
+        Returns:
+            str: The type of object, or `None` if the type cannot be determined
+
+        """
+        for field in self.designator_fields:
+            value = obj.get(field)
+            if value is None:
+                continue
+            if isinstance(value, str) and value in self.class_map:
+                target_class = self.class_map[value]
+                if not is_supported or is_supported(target_class):
+                    return target_class
+            if default:
+                return default
+            fallback_class = self.fallback_map.get(field)
+            if fallback_class and (not is_supported or is_supported(fallback_class)):
+                return fallback_class
+            return None
+        return default
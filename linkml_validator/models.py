@@ -42,3 +42,28 @@ class ValidationReport(BaseModel):
     type: str
     valid: bool
     validation_results: List[ValidationResult]
+
+
+class ComparisonResult(BaseModel):
+    """
+    ComparisonResult represents how the validation of an object
+    against a schema differs from its validation against the
+    baseline (i.e. first) schema.
+    """
+    schema_source: str
+    valid: bool
+    new_messages: List[ValidationMessage] = []
+    fixed_messages: List[ValidationMessage] = []
+
+
+class ComparisonReport(BaseModel):
+    """
+    ComparisonReport represents the result of validation for
+    a given object against multiple schemas.
+    """
+    object: Optional[Dict]
+    type: Optional[str]
+    schema_source: str
+    valid: bool
+    changed: bool
+    comparison_results: List[ComparisonResult]
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Dict
-from linkml_validator.models import ValidationResult
+from typing import Dict, Generator
+from linkml_validator.models import ValidationReport, ValidationResult
 
 
 
@@ -38,3 +38,71 @@ class BasePlugin(ABC):
 
         """
         ...
+
+    def can_process(self, target_class: str) -> bool:
+        """
+        Check whether the plugin can process objects of a given type.
+
+        Args:
+            target_class: The type of object
+
+        Returns:
+            bool: Whether or not the plugin can process objects of the given type
+
+        """
+        return True
+
+
+class BaseDatasetPlugin(BasePlugin):
+    """
+    Base plugin class that all dataset-level validation plugins should inherit from.
+
+    Unlike a `BasePlugin`, a dataset plugin does not report results for each object.
+    Instead, it records what it needs from each object, after all per-object plugins
+    have processed the object, and reports any violations once all the objects from
+    a dataset have been processed.
+
+    A dataset plugin must be reset at the end of a dataset, whether or not
+    `finalize` was called, so that no state carries over to the next dataset.
+
+    :param schema: Path or URL to schema YAML
+    :param kwargs:
+
+    """
+
+    NAME = "BaseDatasetPlugin"
+
+    @abstractmethod
+    def process(self, obj: Dict, **kwargs) -> None:
+        """
+        Record the given object as part of the dataset.
+
+        Args:
+            obj: The object to record
+            kwargs: Additional arguments that are used for processing
+
+        """
+        ...
+
+    @abstractmethod
+    def reset(self) -> None:
+        """
+        Discard everything recorded so far, and release any resources
+        held by the plugin.
+        """
+        ...
+
+    @abstractmethod
+    def finalize(self, **kwargs) -> Generator[ValidationReport, None, None]:
+        """
+        Validate the dataset as a whole, based on all the objects recorded so far,
+        and reset the plugin for the next dataset.
+
+        Args:
+            kwargs: Additional arguments that are used for processing
+
+        Returns:
+            Generator: A generator that can be iterated to get a list of validation reports
+
+        """
+        ...
@@ -30,6 +30,7 @@ class JsonSchemaValidationPlugin(BasePlugin):
         self.jsonschema_generator = jsonschema_generator
         self.generator_args = generator_args if generator_args else {}
         self.jsonschema_obj_map = {}
+        self.validator_map = {}
         class_list = None
         if 'class_list' in kwargs:
             class_list = kwargs['class_list']
@@ -37,8 +38,8 @@ class JsonSchemaValidationPlugin(BasePlugin):
 
     def _generate_jsonschema(self, class_list: List[str] = None) -> None:
         """
-        Generate JSON Schema representation for all (or specific) classes
-        in the schema.
+        Generate JSON Schema representation, and a compiled JSONSchema validator,
+        for all (or specific) classes in the schema.
 
         Args:
             class_list: A list of classes for which to generate JSONSchema
@@ -68,6 +69,20 @@ class JsonSchemaValidationPlugin(BasePlugin):
                     target_jsonschema_obj['properties'] = jsonschema_obj["$defs"][formatted_name].get('properties', {})
                     target_jsonschema_obj['required'] = jsonschema_obj["$defs"][formatted_name].get('required', [])
                     self.jsonschema_obj_map[formatted_name] = target_jsonschema_obj
+                    self.validator_map[formatted_name] = jsonschema.Draft7Validator(target_jsonschema_obj)
+
+    def can_process(self, target_class: str) -> bool:
+        """
+        Check whether there is a JSONSchema for a given type.
+
+        Args:
+            target_class: The type of object
+
+        Returns:
+            bool: Whether or not objects of the given type can be validated
+
+        """
+        return target_class in self.validator_map
 
     def process(self, obj: Dict, **kwargs) -> ValidationResult:
         """
@@ -89,8 +104,13 @@ class JsonSchemaValidationPlugin(BasePlugin):
             truncate_message = False
         target_class = kwargs["target_class"]
         valid = True
-        jsonschema_obj = self.jsonschema_obj_map[target_class]
-        validator = jsonschema.Draft7Validator(jsonschema_obj)
+        if not self.can_process(target_class):
+            message = ValidationMessage(
+                severity=SeverityEnum.error.value,
+                message=f"Cannot validate an object of type {target_class}, which has no JSONSchema.",
+            )
+            return ValidationResult(plugin_name=self.NAME, valid=False, validation_messages=[message])
+        validator = self.validator_map[target_class]
         errors = [x for x in validator.iter_errors(obj)]
         result = ValidationResult(
             plugin_name=self.NAME,
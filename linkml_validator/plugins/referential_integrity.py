@@ -0,0 +1,389 @@
+import os
+import sqlite3
+import tempfile
+from typing import Dict, Generator, List, Optional, Tuple, Union
+from linkml_runtime.utils.schemaview import SchemaView
+from linkml_runtime.utils.formatutils import camelcase, underscore
+from linkml_validator.models import SeverityEnum, ValidationMessage, ValidationReport, ValidationResult
+from linkml_validator.plugins.base import BaseDatasetPlugin
+
+
+class IdentifierIndex:
+    """
+    An index of the identifiers, and references to identifiers, seen across a dataset.
+
+    The index is held in memory until it holds more than `max_in_memory` entries,
+    after which it is spilled to an on-disk SQLite store, so that the index can
+    scale beyond the available memory.
+
+    Identifiers are compared by both type and value, i.e. `1` and `"1"` are
+    different identifiers.
+
+    Args:
+        max_in_memory: The maximum number of entries to hold in memory
+        batch_size: The number of entries to write to the on-disk store at a time
+        directory: The directory in which to create the on-disk store
+
+    """
+
+    def __init__(self, max_in_memory: int = 1000000, batch_size: int = 10000, directory: str = None) -> None:
+        self.max_in_memory = max_in_memory
+        self.batch_size = batch_size
+        self.directory = directory
+        self.identifiers = {}
+        self.duplicates = []
+        self.pending_identifiers = []
+        self.references = []
+        self.connection = None
+        self.filename = None
+
+    @staticmethod
+    def _get_key(identifier: Union[str, int]) -> Tuple[str, Union[str, int]]:
+        """
+        Get the key for an identifier in the index.
+
+        Args:
+            identifier: The identifier
+
+        Returns:
+            tuple: The type and value of the identifier
+
+        """
+        return type(identifier).__name__, identifier
+
+    @staticmethod
+    def _to_row(id_type: str, identifier: Union[str, int]) -> Tuple[str, str]:
+        """
+        Get the representation of an identifier in the on-disk store.
+
+        Identifiers are stored as text, since integers may be outside the
+        range of a SQLite INTEGER, and their type is stored alongside.
+
+        Args:
+            id_type: The type of the identifier
+            identifier: The identifier
+
+        Returns:
+            tuple: The type of the identifier and the identifier as text
+
+        """
+        return id_type, str(identifier)
+
+    @staticmethod
+    def _from_row(id_type: str, identifier: str) -> Union[str, int]:
+        """
+        Get an identifier from its representation in the on-disk store.
+
+        Args:
+            id_type: The type of the identifier
+            identifier: The identifier as text
+
+        Returns:
+            Union[str, int]: The identifier
+
+        """
+        return int(identifier) if id_type == "int" else identifier
+
+    def add_identifier(self, identifier: Union[str, int], record: int, target_class: str) -> None:
+        """
+        Add an identifier to the index.
+
+        Args:
+            identifier: The identifier
+            record: The position of the object, in the dataset, that has the identifier
+            target_class: The type of the object
+
+        """
+        key = self._get_key(identifier)
+        if self.connection:
+            self.pending_identifiers.append((*self._to_row(*key), record, target_class))
+        elif key in self.identifiers:
+            self.duplicates.append((identifier, record, target_class, self.identifiers[key][0]))
+        else:
+            self.identifiers[key] = (record, target_class)
+        self._check_size()
+
+    def add_reference(self, identifier: Union[str, int], record: int, target_class: str, field: str) -> None:
+        """
+        Add a reference to an identifier to the index.
+
+        Args:
+            identifier: The referenced identifier
+            record: The position of the object, in the dataset, that has the reference
+            target_class: The type of the object
+            field: The field of the object that has the reference
+
+        """
+        key = self._get_key(identifier)
+        if self.connection:
+            key = self._to_row(*key)
+        self.references.append((*key, record, target_class, field))
+        self._check_size()
+
+    def _check_size(self) -> None:
+        """
+        Spill the index to disk, or flush the pending entries to disk, if there
+        are too many entries held in memory.
+        """
+        if self.connection:
+            if len(self.pending_identifiers) + len(self.references) >= self.batch_size:
+                self._flush()
+        elif len(self.identifiers) + len(self.duplicates) + len(self.references) > self.max_in_memory:
+            self._spill()
+
+    def _spill(self) -> None:
+        """
+        Move the index to an on-disk store.
+        """
+        file_descriptor, self.filename = tempfile.mkstemp(suffix=".sqlite", dir=self.directory)
+        os.close(file_descriptor)
+        self.connection = sqlite3.connect(self.filename)
+        self.connection.execute("PRAGMA journal_mode = OFF")
+        self.connection.execute("PRAGMA synchronous = OFF")
+        self.connection.execute("CREATE TABLE identifiers (id_type TEXT, id TEXT, record INTEGER, class TEXT)")
+        self.connection.execute("CREATE TABLE refs (id_type TEXT, id TEXT, record INTEGER, class TEXT, field TEXT)")
+        self.connection.executemany(
+            "INSERT INTO identifiers VALUES (?, ?, ?, ?)",
+            ((*self._to_row(*key), record, target_class) for key, (record, target_class) in self.identifiers.items())
+        )
+        self.connection.executemany(
+            "INSERT INTO identifiers VALUES (?, ?, ?, ?)",
+            (
+                (*self._to_row(*self._get_key(identifier)), record, target_class)
+                for identifier, record, target_class, _ in self.duplicates
+            )
+        )
+        self.identifiers = {}
+        self.duplicates = []
+        self.references = [
+            (*self._to_row(id_type, identifier), record, target_class, field)
+            for id_type, identifier, record, target_class, field in self.references
+        ]
+        self._flush()
+
+    def _flush(self) -> None:
+        """
+        Write all pending entries to the on-disk store.
+        """
+        self.connection.executemany("INSERT INTO identifiers VALUES (?, ?, ?, ?)", self.pending_identifiers)
+        self.connection.executemany("INSERT INTO refs VALUES (?, ?, ?, ?, ?)", self.references)
+        self.connection.commit()
+        self.pending_identifiers = []
+        self.references = []
+
+    def get_duplicates(self) -> Generator[Tuple[Union[str, int], int, str, int], None, None]:
+        """
+        Get all the duplicate identifiers in the index.
+
+        Returns:
+            Generator: A generator of tuples of the identifier, the position and type of the
+                object with the duplicate identifier, and the position of the first object
+                with the identifier
+
+        """
+        if not self.connection:
+            yield from self.duplicates
+            return
+        self._flush()
+        self.connection.execute("CREATE INDEX IF NOT EXISTS identifiers_id ON identifiers (id_type, id)")
+        rows = self.connection.execute(
+            "SELECT i.id_type, i.id, i.record, i.class, d.first FROM identifiers i "
+            "JOIN (SELECT id_type, id, MIN(record) AS first FROM identifiers "
+            "GROUP BY id_type, id HAVING COUNT(*) > 1) d "
+            "ON i.id_type = d.id_type AND i.id = d.id WHERE i.record != d.first ORDER BY i.record"
+        )
+        for id_type, identifier, record, target_class, first_record in rows:
+            yield self._from_row(id_type, identifier), record, target_class, first_record
+
+    def get_dangling_references(self) -> Generator[Tuple[Union[str, int], int, str, str], None, None]:
+        """
+        Get all the references, in the index, to identifiers that are not in the index.
+
+        Returns:
+            Generator: A generator of tuples of the referenced identifier, the position and type
+                of the object with the reference, and the field with the reference
+
+        """
+        if not self.connection:
+            for id_type, identifier, record, target_class, field in self.references:
+                if (id_type, identifier) not in self.identifiers:
+                    yield identifier, record, target_class, field
+            return
+        self._flush()
+        self.connection.execute("CREATE INDEX IF NOT EXISTS identifiers_id ON identifiers (id_type, id)")
+        rows = self.connection.execute(
+            "SELECT r.id_type, r.id, r.record, r.class, r.field FROM refs r "
+            "WHERE NOT EXISTS (SELECT 1 FROM identifiers i WHERE i.id_type = r.id_type AND i.id = r.id) "
+            "ORDER BY r.record"
+        )
+        for id_type, identifier, record, target_class, field in rows:
+            yield self._from_row(id_type, identifier), record, target_class, field
+
+    def close(self) -> None:
+        """
+        Clear the index and remove the on-disk store, if any.
+        """
+        if self.connection:
+            self.connection.close()
+            os.remove(self.filename)
+        self.identifiers = {}
+        self.duplicates = []
+        self.pending_identifiers = []
+        self.references = []
+        self.connection = None
+        self.filename = None
+
+
+class ReferentialIntegrityPlugin(BaseDatasetPlugin):
+    """
+    Plugin to check that identifiers are unique across a dataset, and that
+    all references to other objects point to an identifier in the dataset.
+
+    Args:
+        schema: Path or URL to schema YAML
+        max_in_memory: The maximum number of entries to hold in memory before
+            spilling the index to disk
+        directory: The directory in which to create the on-disk index
+        kwargs: Additional arguments that are used to instantiate the plugin
+
+    """
+
+    NAME = "ReferentialIntegrityPlugin"
+
+    def __init__(self, schema: str, max_in_memory: int = 1000000, directory: str = None, **kwargs) -> None:
+        super().__init__(schema)
+        self.schemaview = SchemaView(schema)
+        self.class_names = {camelcase(x): x for x in self.schemaview.all_classes()}
+        self.slot_map = {}
+        self.index = IdentifierIndex(max_in_memory=max_in_memory, directory=directory)
+        self.count = 0
+
+    def _get_slots(self, target_class: str) -> Tuple[Optional[str], List[str]]:
+        """
+        Get the identifier field and the reference fields for a given class.
+
+        Args:
+            target_class: The type of object
+
+        Returns:
+            tuple: The identifier field, if any, and a list of fields that
+                reference other objects by their identifier
+
+        """
+        if target_class not in self.slot_map:
+            identifier_field = None
+            reference_fields = []
+            class_name = self.class_names.get(target_class)
+            if class_name:
+                identifier_slot = self.schemaview.get_identifier_slot(class_name)
+                if identifier_slot:
+                    identifier_field = underscore(identifier_slot.name)
+                all_classes = self.schemaview.all_classes()
+                for slot_def in self.schemaview.class_induced_slots(class_name):
+                    if (
+                        slot_def.range in all_classes
+                        and self.schemaview.get_identifier_slot(slot_def.range)
+                        and not self.schemaview.is_inlined(slot_def)
+                    ):
+                        reference_fields.append(underscore(slot_def.name))
+            self.slot_map[target_class] = (identifier_field, reference_fields)
+        return self.slot_map[target_class]
+
+    def process(self, obj: Dict, **kwargs) -> None:
+        """
+        Record the identifier of an object, and its references to other objects.
+
+        Args:
+            obj: The object to record
+            kwargs: Additional arguments that are used for processing
+
+        """
+        if "target_class" not in kwargs:
+            raise Exception("Need `target_class` argument")
+        target_class = kwargs["target_class"]
+        record = self.count
+        self.count += 1
+        identifier_field, reference_fields = self._get_slots(target_class)
+        if identifier_field and self._is_identifier(obj.get(identifier_field)):
+            self.index.add_identifier(obj[identifier_field], record, target_class)
+        for field in reference_fields:
+            value = obj.get(field)
+            values = value if isinstance(value, list) else [value]
+            for value in values:
+                if self._is_identifier(value):
+                    self.index.add_reference(value, record, target_class, field)
+
+    @staticmethod
+    def _is_identifier(value) -> bool:
+        """
+        Check whether a value can be indexed as an identifier.
+
+        Args:
+            value: The value
+
+        Returns:
+            bool: Whether or not the value is a string or an integer
+
+        """
+        return isinstance(value, (str, int)) and not isinstance(value, bool)
+
+    def reset(self) -> None:
+        """
+        Clear the index, removing any on-disk store, for the next dataset.
+        """
+        self.index.close()
+        self.count = 0
+
+    def finalize(self, **kwargs) -> Generator[ValidationReport, None, None]:
+        """
+        Report duplicate identifiers and references to identifiers that
+        are not in the dataset.
+
+        Args:
+            kwargs: Additional arguments that are used for processing
+
+        Returns:
+            Generator: A generator that can be iterated to get a list of validation reports
+
+        """
+        try:
+            for identifier, record, target_class, first_record in self.index.get_duplicates():
+                identifier_field = self._get_slots(target_class)[0]
+                message = ValidationMessage(
+                    severity=SeverityEnum.error.value,
+                    message=f"{target_class}.{identifier_field} of object {record} has the value "
+                    + f"'{identifier}', which is already used by object {first_record}",
+                    field=identifier_field,
+                    value=identifier
+                )
+                yield self._get_report(target_class, message)
+            for identifier, record, target_class, field in self.index.get_dangling_references():
+                message = ValidationMessage(
+                    severity=SeverityEnum.error.value,
+                    message=f"{target_class}.{field} of object {record} references "
+                    + f"'{identifier}', which is not found in the dataset",
+                    field=field,
+                    value=identifier
+                )
+                yield self._get_report(target_class, message)
+        finally:
+            self.reset()
+
+    def _get_report(self, target_class: str, message: ValidationMessage) -> ValidationReport:
+        """
+        Get a validation report for a single dataset-level validation message.
+
+        Args:
+            target_class: The type of object that the message is about
+            message: The validation message
+
+        Returns:
+            ValidationReport: A validation report that summarizes the validation
+
+        """
+        result = ValidationResult(
+            plugin_name=self.NAME, valid=False, validation_messages=[message]
+        )
+        return ValidationReport(
+            object=None, type=target_class, valid=False, validation_results=[result]
+        )
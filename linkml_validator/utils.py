@@ -1,9 +1,16 @@
 import builtins
+import bz2
+import gzip
 import importlib
+import io
 import json
+import lzma
+import os
+import queue
+import threading
 from functools import lru_cache
 import reprlib
-from typing import Dict
+from typing import Dict, IO, Iterator, Optional, Tuple
 
 import stringcase
 from linkml.utils.generator import Generator
@@ -140,3 +147,259 @@ def truncate(text_str: str, max_length: int = 256) -> str:
         truncated_str = text_str[:i] + text_str[len(text_str)-j:]
         truncated_str = truncated_str[:i] + '...' + truncated_str[len(truncated_str)-j:]
     return truncated_str
+
+
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".lzma": "xz",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+}
+
+COMPRESSION_MAGIC_BYTES = {
+    b"\x1f\x8b": "gzip",
+    b"BZh": "bz2",
+    b"\xfd7zXZ\x00": "xz",
+    b"\x28\xb5\x2f\xfd": "zstd",
+}
+
+
+def get_zstd_module() -> Optional[object]:
+    """
+    Get a module that provides zstd decompression, if one is available.
+
+    Returns:
+        object: A module with an `open` function, or `None` if zstd is not supported
+
+    """
+    for module_name in ["compression.zstd", "backports.zstd", "zstandard"]:
+        try:
+            return importlib.import_module(module_name)
+        except ImportError:
+            continue
+    return None
+
+
+def detect_compression(filename: str) -> Optional[str]:
+    """
+    Detect the compression of a file, first from its suffix and then
+    from the magic bytes at the start of the file.
+
+    Args:
+        filename: The filename
+
+    Returns:
+        str: The compression format (one of `gzip`, `bz2`, `xz`, `zstd`), or `None` if
+            the file is not compressed
+
+    """
+    suffix = os.path.splitext(str(filename))[1].lower()
+    if suffix in COMPRESSION_SUFFIXES:
+        return COMPRESSION_SUFFIXES[suffix]
+    with open(filename, "rb") as file:
+        header = file.read(max(len(x) for x in COMPRESSION_MAGIC_BYTES))
+    for magic_bytes, compression in COMPRESSION_MAGIC_BYTES.items():
+        if header.startswith(magic_bytes):
+            return compression
+    return None
+
+
+def get_base_suffix(filename: str) -> str:
+    """
+    Get the suffix of a file, ignoring any compression suffix.
+
+    Args:
+        filename: The filename
+
+    Returns:
+        str: The suffix of the file (for example, `.json` for `data.json.gz`)
+
+    """
+    root, suffix = os.path.splitext(str(filename))
+    if suffix.lower() in COMPRESSION_SUFFIXES:
+        suffix = os.path.splitext(root)[1]
+    return suffix.lower()
+
+
+def open_compressed(filename: str, compression: str) -> IO[bytes]:
+    """
+    Open a compressed file for reading in binary mode.
+
+    Args:
+        filename: The filename
+        compression: The compression format (one of `gzip`, `bz2`, `xz`, `zstd`)
+
+    Returns:
+        IO[bytes]: A binary file object that yields decompressed bytes
+
+    """
+    if compression == "gzip":
+        return gzip.open(filename, "rb")
+    if compression == "bz2":
+        return bz2.open(filename, "rb")
+    if compression == "xz":
+        return lzma.open(filename, "rb")
+    if compression == "zstd":
+        zstd = get_zstd_module()
+        if not zstd:
+            raise Exception(f"Cannot read {filename}. Install 'backports.zstd' or 'zstandard' to read zstd compressed files.")
+        return zstd.open(filename, "rb")
+    raise Exception(f"Unsupported compression '{compression}' for {filename}")
+
+
+class BackgroundReader(io.RawIOBase):
+    """
+    A readable binary stream that reads from another stream in a background
+    thread, via a bounded buffer of chunks.
+
+    This allows for decompression of the underlying stream to overlap
+    with the parsing and validation of its contents.
+
+    Args:
+        stream: The binary stream to read from
+        chunk_size: The size, in bytes, of each chunk read from the stream
+        max_chunks: The maximum number of chunks held in the buffer
+
+    """
+
+    def __init__(self, stream: IO[bytes], chunk_size: int = 1024 * 1024, max_chunks: int = 8) -> None:
+        super().__init__()
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self._queue = queue.Queue(maxsize=max_chunks)
+        self._stop = threading.Event()
+        self._chunk = memoryview(b"")
+        self._done = False
+        self._thread = threading.Thread(target=self._fill, daemon=True)
+        self._thread.start()
+
+    def _put(self, item) -> bool:
+        """
+        Put an item into the buffer, waiting for space unless the reader is closed.
+
+        Args:
+            item: The item to put into the buffer
+
+        Returns:
+            bool: Whether or not the item was added to the buffer
+
+        """
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fill(self) -> None:
+        """
+        Read chunks from the underlying stream into the buffer.
+        """
+        try:
+            while True:
+                chunk = self.stream.read(self.chunk_size)
+                if not chunk or not self._put(chunk):
+                    break
+        except Exception as e:
+            self._put(e)
+        finally:
+            self._put(None)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        """
+        Read bytes from the buffer into a pre-allocated bytes-like object.
+
+        Args:
+            buffer: The bytes-like object to read into
+
+        Returns:
+            int: The number of bytes read, which is 0 at the end of the stream
+
+        """
+        if not self._chunk and not self._done:
+            item = self._queue.get()
+            if item is None:
+                self._done = True
+            elif isinstance(item, Exception):
+                self._done = True
+                raise item
+            else:
+                self._chunk = memoryview(item)
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+            self.stream.close()
+        super().close()
+
+
+def open_file(filename: str, encoding: str = "UTF-8", background: bool = False) -> IO[str]:
+    """
+    Open a file for reading in text mode, transparently decompressing
+    gzip, bz2, xz and zstd compressed files.
+
+    Args:
+        filename: The filename
+        encoding: The text encoding of the (decompressed) file
+        background: Whether or not to decompress in a background thread, so that
+            decompression overlaps with the consumer of the returned stream.
+            This only helps consumers that read the stream incrementally.
+
+    Returns:
+        IO[str]: A text file object
+
+    """
+    compression = detect_compression(filename)
+    if not compression:
+        return open(filename, "r", encoding=encoding)
+    stream = open_compressed(filename, compression)
+    if background:
+        stream = io.BufferedReader(BackgroundReader(stream))
+    return io.TextIOWrapper(stream, encoding=encoding)
+
+
+def read_objects(filename: str, target_class: str = None) -> Iterator[Tuple[Optional[str], Dict]]:
+    """
+    Read all objects from a file.
+
+    The file can be JSON or JSON Lines (`.jsonl`), optionally compressed
+    with gzip, bz2, xz or zstd. A JSON file is parsed as a whole, whereas a
+    JSON Lines file is parsed line by line while it is decompressed in a
+    background thread.
+
+    Args:
+        filename: The filename
+        target_class: The target class which all objects from the input JSON are an instance of
+
+    Returns:
+        Iterator: An iterator of tuples of the type of object, which is `target_class` unless
+            the input JSON is keyed by the type of object, and the object
+
+    """
+    is_jsonl = get_base_suffix(filename) == ".jsonl"
+    with open_file(filename, background=is_jsonl) as file:
+        if is_jsonl:
+            for line in file:
+                if line.strip():
+                    yield target_class, json.loads(line)
+            return
+        data = json.load(file)
+        if isinstance(data, list):
+            for obj in data:
+                yield target_class, obj
+        else:
+            for target_class, objects in data.items():
+                for obj in objects:
+                    yield target_class, obj
@@ -1,15 +1,28 @@
+import itertools
 import json
-from typing import Dict, Generator, List, Set
+import re
+import sqlite3
+from typing import Dict, Generator, List, Set, Tuple
 
-from linkml_validator.models import ValidationReport
-from linkml_validator.plugins.base import BasePlugin
+from linkml_validator.dispatcher import TypeDesignatorDispatcher
+from linkml_validator.models import (
+    ComparisonReport,
+    ComparisonResult,
+    ValidationMessage,
+    ValidationReport,
+    ValidationResult,
+)
+from linkml_validator.plugins.base import BaseDatasetPlugin, BasePlugin
 from linkml_validator.plugins.jsonschema_validation import JsonSchemaValidationPlugin
+from linkml_validator.utils import read_objects
 
 
 DEFAULT_PLUGINS = {
     "JsonSchemaValidationPlugin": JsonSchemaValidationPlugin
 }
 
+ENUM_MESSAGE_PATTERN = re.compile(r" is not one of \[.*\]$", re.DOTALL)
+
 
 class Validator:
     """
@@ -23,7 +36,9 @@ class Validator:
 
     def __init__(self, schema: str, plugins: List[Dict] = None) -> None:
         self.schema = schema
+        self._dispatcher = None
         self.plugins = []
+        self.dataset_plugins = []
         if plugins:
             for plugin in plugins:
                 plugin_class = plugin["plugin_class"]
@@ -33,18 +48,34 @@ class Validator:
                 if not issubclass(plugin_class, BasePlugin):
                     raise Exception(f"{plugin_class} must be a subclass of {BasePlugin}")
                 instance = plugin_class(schema=self.schema, **plugin_args)
-                self.plugins.append(instance)
+                if isinstance(instance, BaseDatasetPlugin):
+                    self.dataset_plugins.append(instance)
+                else:
+                    self.plugins.append(instance)
         else:
             for plugin_class in DEFAULT_PLUGINS.values():
                 instance = plugin_class(schema=self.schema)
                 self.plugins.append(instance)
 
+    @property
+    def dispatcher(self) -> TypeDesignatorDispatcher:
+        """
+        The dispatcher to determine the type of objects from their type designator,
+        which is only built when it is first needed.
+        """
+        if not self._dispatcher:
+            self._dispatcher = TypeDesignatorDispatcher(self.schema)
+        return self._dispatcher
+
     def validate(
         self, obj: Dict, target_class: str, strict: bool = False, **kwargs
     ) -> ValidationReport:
         """
         Validate an object.
 
+        The object is not recorded by dataset plugins. See `record` for
+        dataset-level validation.
+
         Args:
             obj: The object to validate
             target_class: The type of object
@@ -83,6 +114,16 @@ class Validator:
         """
         Validate all objects from a file.
 
+        Once all objects from the file have been validated, any dataset-level
+        validation is performed, and its validation reports are yielded last.
+
+        The file can be JSON or JSON Lines (`.jsonl`), optionally compressed
+        with gzip, bz2, xz or zstd.
+
+        If the schema has a type designator slot, then the type of each object is
+        determined from its type designator, with `target_class` (or the type that
+        the objects are keyed by in the input JSON) used as a fallback.
+
         Args:
             filename: The filename
             target_class: The target class which all objects from the input JSON are an instance of
@@ -93,21 +134,345 @@ class Validator:
             Generator: A generator that can be iterated to get a list of validation reports
 
         """
-        with open(filename, "r", encoding="UTF-8") as file:
-            data = json.load(file)
-            if isinstance(data, list):
-                if target_class:
-                    for obj in data:
-                        report = self.validate(
-                            obj=obj, target_class=target_class, strict=strict
-                        )
-                        yield report
-                else:
-                    raise Exception(f"target_class not defined. Cannot validate array of objects from {filename}.")
-            else:
-                for target_class, objects in data.items():
-                    for obj in objects:
-                        report = self.validate(
-                            obj=obj, target_class=target_class, strict=strict
+        self.reset()
+        try:
+            for default_class, obj in read_objects(filename=filename, target_class=target_class):
+                obj_class = self.get_target_class(obj, default_class, filename)
+                report = self.validate(obj=obj, target_class=obj_class, strict=strict)
+                self.record(obj=obj, target_class=obj_class)
+                yield report
+            yield from self.finalize()
+        finally:
+            self.reset()
+
+    def record(self, obj: Dict, target_class: str, **kwargs) -> None:
+        """
+        Record an object with all dataset plugins, for dataset-level validation.
+
+        Objects are recorded until `finalize` or `reset` is called, which
+        must be done once all objects from a dataset have been recorded.
+
+        Args:
+            obj: The object to record
+            target_class: The type of object
+            kwargs: Any additional arguments
+
+        """
+        for plugin in self.dataset_plugins:
+            plugin.process(obj=obj, target_class=target_class, **kwargs)
+
+    def reset(self) -> None:
+        """
+        Discard all objects recorded by dataset plugins so far.
+        """
+        for plugin in self.dataset_plugins:
+            plugin.reset()
+
+    def can_validate(self, target_class: str) -> bool:
+        """
+        Check whether all plugins can validate objects of a given type.
+
+        Args:
+            target_class: The type of object
+
+        Returns:
+            bool: Whether or not objects of the given type can be validated
+
+        """
+        return all(plugin.can_process(target_class) for plugin in self.plugins)
+
+    def get_target_class(self, obj: Dict, target_class: str = None, filename: str = None) -> str:
+        """
+        Get the type of an object from its type designator, if any. Only types
+        that all plugins can validate are considered.
+
+        Args:
+            obj: The object
+            target_class: The type of object to use if it cannot be determined
+                from a type designator
+            filename: The file that the object is from
+
+        Returns:
+            str: The type of object
+
+        """
+        obj_class = self.dispatcher.get_target_class(obj, default=target_class, is_supported=self.can_validate)
+        if not obj_class:
+            raise Exception(f"target_class not defined. Cannot validate objects from {filename}.")
+        return obj_class
+
+    def finalize(self, **kwargs) -> Generator:
+        """
+        Run dataset-level validation on all objects recorded so far,
+        and reset the dataset plugins for the next dataset.
+
+        Args:
+            kwargs: Any additional arguments
+
+        Returns:
+            Generator: A generator that can be iterated to get a list of validation reports
+
+        """
+        for plugin in self.dataset_plugins:
+            yield from plugin.finalize(**kwargs)
+
+
+class MultiValidator:
+    """
+    Validator to validate data against multiple schemas, such as
+    different versions of a schema, in a single pass.
+
+    Each object is read once and validated against every schema. The validation
+    against each schema is then compared to the validation against the first
+    (baseline) schema, and only the differences are reported.
+
+    Args:
+        schemas: A list of paths or URLs to schema YAML, where the first is the baseline
+        plugins: A list of plugin classes to use for validation against each schema
+
+    """
+
+    def __init__(self, schemas: List[str], plugins: List[Dict] = None) -> None:
+        if len(schemas) < 2:
+            raise Exception("MultiValidator needs at least two schemas")
+        self.schemas = schemas
+        self.validators = [Validator(schema=schema, plugins=plugins) for schema in schemas]
+
+    def validate(
+        self, obj: Dict, target_class: str, strict: bool = False, **kwargs
+    ) -> ComparisonReport:
+        """
+        Validate an object against all schemas.
+
+        Args:
+            obj: The object to validate
+            target_class: The type of object
+            strict: Whether or not to perform strict validation, where any validation
+                error stops the validation process. Defaults to `False`.
+            kwargs: Any additional arguments
+
+        Returns:
+            ComparisonReport: A comparison report that summarizes the differences in validation
+
+        """
+        return self._validate(obj, [target_class] * len(self.validators), strict=strict, **kwargs)
+
+    def validate_file(
+        self, filename: str, target_class: str = None, strict: bool = False
+    ) -> Generator:
+        """
+        Validate all objects from a file against all schemas.
+
+        The type of each object is determined separately for each schema, as for
+        `Validator.validate_file`. Once all objects from the file have been validated,
+        the dataset-level validation against all schemas is compared, and a comparison
+        report for each dataset-level validation message is yielded last.
+
+        Args:
+            filename: The filename
+            target_class: The target class which all objects from the input JSON are an instance of
+            strict: Whether or not to perform strict validation, where any validation
+                error stops the validation process. Defaults to `False`.
+
+        Returns:
+            Generator: A generator that can be iterated to get a list of comparison reports
+
+        """
+        for validator in self.validators:
+            validator.reset()
+        try:
+            for default_class, obj in read_objects(filename=filename, target_class=target_class):
+                target_classes = [
+                    validator.get_target_class(obj, default_class, filename) for validator in self.validators
+                ]
+                report = self._validate(obj, target_classes, strict=strict)
+                for validator, obj_class in zip(self.validators, target_classes):
+                    validator.record(obj=obj, target_class=obj_class)
+                yield report
+            yield from self._compare_datasets()
+        finally:
+            for validator in self.validators:
+                validator.reset()
+
+    def _validate(
+        self, obj: Dict, target_classes: List[str], strict: bool = False, **kwargs
+    ) -> ComparisonReport:
+        """
+        Validate an object against all schemas.
+
+        Args:
+            obj: The object to validate
+            target_classes: The type of object, for each schema
+            strict: Whether or not to perform strict validation, where any validation
+                error stops the validation process. Defaults to `False`.
+            kwargs: Any additional arguments
+
+        Returns:
+            ComparisonReport: A comparison report that summarizes the differences in validation
+
+        """
+        exclude_object = kwargs.pop("exclude_object", False)
+        reports = [
+            validator.validate(obj=obj, target_class=target_class, strict=strict, exclude_object=True, **kwargs)
+            for validator, target_class in zip(self.validators, target_classes)
+        ]
+        return self._compare(
+            obj if not exclude_object else None,
+            target_classes[0],
+            [report.valid for report in reports],
+            [self._get_messages(report.validation_results) for report in reports],
+        )
+
+    def _compare(self, obj: Dict, target_class: str, valid: List[bool], messages: List[Dict]) -> ComparisonReport:
+        """
+        Compare the validation of an object against all schemas
+        with its validation against the baseline schema.
+
+        Args:
+            obj: The object that was validated
+            target_class: The type of object, for the baseline schema
+            valid: Whether or not the object is valid, for each schema
+            messages: The validation messages, as returned by `_get_messages`, for each schema
+
+        Returns:
+            ComparisonReport: A comparison report that summarizes the differences in validation
+
+        """
+        comparison_results = []
+        changed = False
+        for schema, schema_valid, schema_messages in zip(self.schemas[1:], valid[1:], messages[1:]):
+            comparison_result = ComparisonResult(
+                schema_source=schema,
+                valid=schema_valid,
+                new_messages=self._get_difference(schema_messages, messages[0]),
+                fixed_messages=self._get_difference(messages[0], schema_messages),
+            )
+            if (
+                comparison_result.valid != valid[0]
+                or comparison_result.new_messages
+                or comparison_result.fixed_messages
+            ):
+                changed = True
+            comparison_results.append(comparison_result)
+        return ComparisonReport(
+            object=obj,
+            type=target_class,
+            schema_source=self.schemas[0],
+            valid=valid[0],
+            changed=changed,
+            comparison_results=comparison_results,
+        )
+
+    def _compare_datasets(self) -> Generator:
+        """
+        Compare the dataset-level validation against all schemas with the
+        dataset-level validation against the baseline schema.
+
+        The dataset-level validation messages are streamed into a temporary
+        on-disk SQLite store, rather than held in memory, and a comparison report
+        is yielded for each distinct validation message.
+
+        Returns:
+            Generator: A generator that can be iterated to get a list of comparison reports
+
+        """
+        # An empty filename creates a temporary database, which is deleted when closed
+        connection = sqlite3.connect("")
+        try:
+            connection.execute(
+                "CREATE TABLE messages "
+                "(key TEXT, schema INTEGER, type TEXT, severity TEXT, field TEXT, value TEXT, message TEXT)"
+            )
+            for i, validator in enumerate(self.validators):
+                connection.executemany(
+                    "INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        (
+                            json.dumps(self._get_key(result.plugin_name, message)),
+                            i,
+                            report.type,
+                            message.severity,
+                            message.field,
+                            json.dumps(message.value, default=str),
+                            message.message,
                         )
-                        yield report
+                        for report in validator.finalize()
+                        for result in report.validation_results
+                        for message in result.validation_messages or []
+                    )
+                )
+            rows = connection.execute("SELECT * FROM messages ORDER BY key, schema, rowid")
+            for key, group in itertools.groupby(rows, key=lambda x: x[0]):
+                messages = [{} for _ in self.validators]
+                target_class = None
+                for _, i, row_type, severity, field, value, text in group:
+                    message = ValidationMessage(
+                        severity=severity, field=field, value=json.loads(value), message=text
+                    )
+                    messages[i].setdefault(key, []).append(message)
+                    target_class = target_class or row_type
+                yield self._compare(None, target_class, [not x for x in messages], messages)
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _get_key(plugin_name: str, message: ValidationMessage) -> Tuple:
+        """
+        Get the key to compare a validation message by.
+
+        The message text is part of the key, since messages for different errors can
+        share a field and value. However, the list of permissible values is removed from
+        enum messages, so that adding a permissible value to an enum does not reword
+        an error that persists.
+
+        Args:
+            plugin_name: The name of the plugin that reported the validation message
+            message: The validation message
+
+        Returns:
+            tuple: The plugin, severity, field, value and (normalized) message
+
+        """
+        return (
+            plugin_name,
+            message.severity,
+            message.field,
+            json.dumps(message.value, sort_keys=True, default=str),
+            ENUM_MESSAGE_PATTERN.sub(" is not one of [...]", message.message),
+        )
+
+    def _get_messages(self, validation_results: List[ValidationResult]) -> Dict:
+        """
+        Get all validation messages from a list of validation results, grouped by `_get_key`.
+
+        Args:
+            validation_results: The validation results
+
+        Returns:
+            dict: The validation messages
+
+        """
+        messages = {}
+        for result in validation_results:
+            for message in result.validation_messages or []:
+                messages.setdefault(self._get_key(result.plugin_name, message), []).append(message)
+        return messages
+
+    @staticmethod
+    def _get_difference(messages: Dict, other_messages: Dict) -> List[ValidationMessage]:
+        """
+        Get the validation messages that are in one group of validation
+        messages but not in another.
+
+        Args:
+            messages: The validation messages, as returned by `_get_messages`
+            other_messages: The validation messages to compare against
+
+        Returns:
+            list: The validation messages that are not in `other_messages`
+
+        """
+        difference = []
+        for key, values in messages.items():
+            difference.extend(values[len(other_messages.get(key, [])):])
+        return difference
@@ -1,11 +1,19 @@
+import bz2
+import gzip
+import json
+import lzma
 import os
 import pytest
 from linkml_validator.plugins.jsonschema_validation import JsonSchemaValidationPlugin
 from linkml_validator.plugins.range_validation import RangeValidationPlugin
+from linkml_validator.plugins.referential_integrity import ReferentialIntegrityPlugin
 
-from linkml_validator.validator import Validator
+from linkml_validator.utils import get_zstd_module
+from linkml_validator.validator import MultiValidator, Validator
 from tests import BASE_DIR
 
+zstd = get_zstd_module()
+
 
 @pytest.mark.parametrize(
     "schema,filename,plugins,validation_status",
@@ -45,3 +53,239 @@ def test_validator(schema, filename, plugins, validation_status):
     reports = [x for x in validator.validate_file(filename=filename)]
     for i in range(0, len(validation_status)):
         assert reports[i].valid == validation_status[i]
+
+
+@pytest.mark.parametrize(
+    "compression,suffix",
+    [
+        (gzip, ".json.gz"),
+        (bz2, ".json.bz2"),
+        (lzma, ".json.xz"),
+        pytest.param(zstd, ".json.zst", marks=pytest.mark.skipif(not zstd, reason="zstd is not available")),
+        (gzip, ".json"),
+        pytest.param(zstd, ".json", marks=pytest.mark.skipif(not zstd, reason="zstd is not available")),
+    ],
+)
+def test_validator_compressed_file(tmp_path, compression, suffix):
+    schema = os.path.join(BASE_DIR, "resources", "schema", "test_schema1.yml")
+    filename = os.path.join(BASE_DIR, "resources", "data", "test_schema1_data.json")
+    compressed_filename = tmp_path / f"test_schema1_data{suffix}"
+    with open(filename, "rb") as file:
+        compressed_filename.write_bytes(compression.compress(file.read()))
+    validator = Validator(schema=schema)
+    reports = [x for x in validator.validate_file(filename=compressed_filename)]
+    assert [x.valid for x in reports] == [True, False, False, False]
+
+
+def test_validator_jsonl_file(tmp_path):
+    schema = os.path.join(BASE_DIR, "resources", "schema", "test_schema1.yml")
+    filename = os.path.join(BASE_DIR, "resources", "data", "test_schema1_data.json")
+    jsonl_filename = tmp_path / "test_schema1_data.jsonl.gz"
+    with open(filename, "r", encoding="UTF-8") as file:
+        objects = json.load(file)["Foo"]
+    with gzip.open(jsonl_filename, "wt", encoding="UTF-8") as file:
+        for obj in objects:
+            file.write(json.dumps(obj) + "\n")
+    validator = Validator(schema=schema)
+    reports = [x for x in validator.validate_file(filename=jsonl_filename, target_class="Foo")]
+    assert [x.valid for x in reports] == [True, False, False, False]
+
+
+@pytest.mark.parametrize(
+    "compression,suffix",
+    [
+        (gzip, ".jsonl.gz"),
+        pytest.param(zstd, ".jsonl.zst", marks=pytest.mark.skipif(not zstd, reason="zstd is not available")),
+    ],
+)
+def test_validator_truncated_jsonl_file(tmp_path, compression, suffix):
+    schema = os.path.join(BASE_DIR, "resources", "schema", "test_schema1.yml")
+    filename = os.path.join(BASE_DIR, "resources", "data", "test_schema1_data.json")
+    jsonl_filename = tmp_path / f"test_schema1_data{suffix}"
+    with open(filename, "r", encoding="UTF-8") as file:
+        objects = json.load(file)["Foo"]
+    data = "".join(json.dumps(obj) + "\n" for obj in objects * 100).encode("UTF-8")
+    compressed_data = compression.compress(data)
+    jsonl_filename.write_bytes(compressed_data[:len(compressed_data) // 2])
+    validator = Validator(schema=schema)
+    with pytest.raises(EOFError):
+        for _ in validator.validate_file(filename=jsonl_filename, target_class="Foo"):
+            pass
+
+
+@pytest.mark.parametrize("max_in_memory", [1000000, 1])
+def test_validator_referential_integrity(tmp_path, max_in_memory):
+    schema = os.path.join(BASE_DIR, "resources", "schema", "test_schema2.yml")
+    filename = os.path.join(BASE_DIR, "resources", "data", "test_schema2_data.json")
+    validator = Validator(
+        schema=schema,
+        plugins=[
+            {"plugin_class": JsonSchemaValidationPlugin},
+            {
+                "plugin_class": ReferentialIntegrityPlugin,
+                "args": {"max_in_memory": max_in_memory, "directory": str(tmp_path)},
+            },
+        ],
+    )
+    reports = [x for x in validator.validate_file(filename=filename)]
+    assert [x.valid for x in reports[:5]] == [True, True, True, True, True]
+    dataset_reports = reports[5:]
+    assert len(dataset_reports) == 3
+    messages = [x.validation_results[0].validation_messages[0] for x in dataset_reports]
+    assert (dataset_reports[0].type, messages[0].field, messages[0].value) == ("Person", "id", "person1")
+    assert sorted((x.field, x.value) for x in messages[1:]) == [("employed_by", "org3"), ("members", "person4")]
+    assert not list(tmp_path.iterdir())
+
+
+def test_validator_type_designator():
+    schema = os.path.join(BASE_DIR, "resources", "schema", "test_schema3.yml")
+    filename = os.path.join(BASE_DIR, "resources", "data", "test_schema3_data.json")
+    validator = Validator(schema=schema)
+    reports = [x for x in validator.validate_file(filename=filename)]
+    assert [x.type for x in reports] == ["Person", "Organization", "Person", "NamedThing"]
+    assert [x.valid for x in reports] == [True, True, False, False]
+    # An unknown subtype is validated against the root class, and its type designator is invalid
+    messages = reports[3].validation_results[0].validation_messages
+    assert [(m.field, m.value) for m in messages] == [("category", "TEST:Student")]
+
+
+def test_validator_type_designator_unsupported_class(tmp_path):
+    schema = os.path.join(BASE_DIR, "resources", "schema", "test_schema3.yml")
+    filename = tmp_path / "data.json"
+    filename.write_text(json.dumps([{"id": "org1", "category": "TEST:Organization"}]))
+    validator = Validator(
+        schema=schema,
+        plugins=[{"plugin_class": JsonSchemaValidationPlugin, "args": {"class_list": ["Person"]}}],
+    )
+    # Organization has no JSONSchema, so the object is validated against the given target class
+    reports = [x for x in validator.validate_file(filename=filename, target_class="Person")]
+    assert [(x.type, x.valid) for x in reports] == [("Person", False)]
+    messages = reports[0].validation_results[0].validation_messages
+    assert [(m.field, m.value) for m in messages] == [("category", "TEST:Organization")]
+    report = validator.validate(obj={"id": "org1"}, target_class="Organization")
+    assert not report.valid
+    assert "has no JSONSchema" in report.validation_results[0].validation_messages[0].message
+
+
+def test_multi_validator():
+    schemas = [
+        os.path.join(BASE_DIR, "resources", "schema", "test_schema1.yml"),
+        os.path.join(BASE_DIR, "resources", "schema", "test_schema1_v2.yml"),
+    ]
+    filename = os.path.join(BASE_DIR, "resources", "data", "test_schema1_data.json")
+    validator = MultiValidator(schemas=schemas)
+    reports = [x for x in validator.validate_file(filename=filename)]
+    assert [x.valid for x in reports] == [True, False, False, False]
+    assert [x.comparison_results[0].valid for x in reports] == [False, False, True, False]
+    assert all(x.changed for x in reports)
+    assert [m.field for m in reports[0].comparison_results[0].new_messages] == ["p2"]
+    assert [m.message for m in reports[1].comparison_results[0].fixed_messages] == ["'p1' is a required property"]
+    assert not reports[2].comparison_results[0].new_messages
+
+
+@pytest.mark.parametrize("max_in_memory", [1000000, 1])
+def test_validator_referential_integrity_abandoned_run(tmp_path, max_in_memory):
+    schema = os.path.join(BASE_DIR, "resources", "schema", "test_schema2.yml")
+    filename = os.path.join(BASE_DIR, "resources", "data", "test_schema2_data.json")
+    validator = Validator(
+        schema=schema,
+        plugins=[
+            {
+                "plugin_class": ReferentialIntegrityPlugin,
+                "args": {"max_in_memory": max_in_memory, "directory": str(tmp_path)},
+            },
+        ],
+    )
+    reports = validator.validate_file(filename=filename)
+    next(reports)
+    next(reports)
+    reports.close()
+    assert not list(tmp_path.iterdir())
+    reports = [x for x in validator.validate_file(filename=filename)]
+    assert len(reports) == 5 + 3
+
+
+@pytest.mark.parametrize("max_in_memory", [1000000, 1])
+def test_validator_referential_integrity_identifier_types(tmp_path, max_in_memory):
+    schema = os.path.join(BASE_DIR, "resources", "schema", "test_schema2.yml")
+    filename = tmp_path / "data.json"
+    objects = [
+        {"id": 1},
+        {"id": "1"},
+        {"id": "1"},
+        {"id": 2**70},
+        {"id": 2**70},
+        {"id": "person1", "employed_by": 2**70},
+        {"id": "person2", "employed_by": str(2**70)},
+    ]
+    filename.write_text(json.dumps({"Person": objects}))
+    validator = Validator(
+        schema=schema,
+        plugins=[
+            {
+                "plugin_class": ReferentialIntegrityPlugin,
+                "args": {"max_in_memory": max_in_memory, "directory": str(tmp_path)},
+            },
+        ],
+    )
+    reports = [x for x in validator.validate_file(filename=filename)]
+    messages = [x.validation_results[0].validation_messages[0] for x in reports[len(objects):]]
+    assert [(x.field, x.value) for x in messages] == [("id", "1"), ("id", 2**70), ("employed_by", str(2**70))]
+    assert list(tmp_path.iterdir()) == [filename]
+
+
+def test_multi_validator_reworded_message():
+    schemas = [
+        os.path.join(BASE_DIR, "resources", "schema", "test_schema1.yml"),
+        os.path.join(BASE_DIR, "resources", "schema", "test_schema1_v3.yml"),
+    ]
+    filename = os.path.join(BASE_DIR, "resources", "data", "test_schema1_data.json")
+    messages = [
+        [m.message for r in Validator(schema=schema).validate_file(filename=filename) for m in r.validation_results[0].validation_messages]
+        for schema in schemas
+    ]
+    assert messages[0] != messages[1]
+    validator = MultiValidator(schemas=schemas)
+    reports = [x for x in validator.validate_file(filename=filename)]
+    # The enum error for p3 persists, although its message now lists the new permissible value
+    assert [x.valid for x in reports] == [True, False, False, False]
+    assert not any(x.changed for x in reports)
+    assert not reports[3].comparison_results[0].new_messages
+    assert not reports[3].comparison_results[0].fixed_messages
+
+
+def test_multi_validator_required_properties(tmp_path):
+    schema = os.path.join(BASE_DIR, "resources", "schema", "test_schema1.yml")
+    schema_b = tmp_path / "test_schema1_p2_required.yml"
+    with open(schema, "r", encoding="UTF-8") as file:
+        schema_b.write_text(file.read().replace(
+            "  p1:\n    required: true\n", "  p1:\n    required: false\n"
+        ).replace(
+            "  p2:\n    range: integer\n", "  p2:\n    range: integer\n    required: true\n"
+        ))
+    validator = MultiValidator(schemas=[schema, str(schema_b)])
+    report = validator.validate(obj={}, target_class="Foo")
+    assert report.changed
+    comparison_result = report.comparison_results[0]
+    assert [m.message for m in comparison_result.new_messages] == ["'p2' is a required property"]
+    assert [m.message for m in comparison_result.fixed_messages] == ["'p1' is a required property"]
+
+
+def test_multi_validator_referential_integrity(tmp_path):
+    schema = os.path.join(BASE_DIR, "resources", "schema", "test_schema2.yml")
+    schema_b = tmp_path / "test_schema2_no_employer_reference.yml"
+    with open(schema, "r", encoding="UTF-8") as file:
+        schema_b.write_text(file.read().replace("    range: organization\n", "    range: string\n"))
+    filename = os.path.join(BASE_DIR, "resources", "data", "test_schema2_data.json")
+    validator = MultiValidator(
+        schemas=[schema, str(schema_b)],
+        plugins=[{"plugin_class": ReferentialIntegrityPlugin}],
+    )
+    reports = [x for x in validator.validate_file(filename=filename)]
+    dataset_reports = reports[5:]
+    assert len(dataset_reports) == 3
+    changed = [x for x in dataset_reports if x.changed]
+    assert len(changed) == 1
+    assert not changed[0].valid
+    assert changed[0].comparison_results[0].valid
+    assert [(m.field, m.value) for m in changed[0].comparison_results[0].fixed_messages] == [("employed_by", "org3")]
@@ -0,0 +1,11 @@
+from linkml_validator.plugins.referential_integrity import IdentifierIndex
+
+
+def test_identifier_index_spills_duplicates(tmp_path):
+    index = IdentifierIndex(max_in_memory=3, directory=str(tmp_path))
+    for record in range(5):
+        index.add_identifier("obj1", record, "Foo")
+    assert index.connection
+    assert [x[1] for x in index.get_duplicates()] == [1, 2, 3, 4]
+    index.close()
+    assert not list(tmp_path.iterdir())